@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert
 
 logger = logging.getLogger("flask.app")
 
@@ -169,12 +170,34 @@ class Product(db.Model):
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
 
+    @classmethod
+    def fast_create(cls, **kwargs):
+        """Creates a Product in the database with a single INSERT ... RETURNING
+
+        :param kwargs: the column values of the new Product
+        :type kwargs: dict
+
+        :return: the new Product with its generated id
+        :rtype: Product
+
+        """
+        logger.info("Creating %s", kwargs.get("name"))
+        product = db.session.scalars(insert(cls).returning(cls), [kwargs]).one()
+        db.session.commit()
+        return product
+
     @classmethod
     def all(cls) -> list:
         """Returns all of the Products in the database"""
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of all Products")
+        return cls.query.count()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID